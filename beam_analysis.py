@@ -1,36 +1,96 @@
+import functools
+from typing import NamedTuple
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+
+class BeamResult(NamedTuple):
+    """Moments and reactions for a beam with a single point load (ndarrays for array-like F or a)."""
+    M_A: float | np.ndarray  # moment at support A
+    M_B: float | np.ndarray  # moment at support B
+    M_F: float | np.ndarray  # moment at the load point
+    R_A: float | np.ndarray  # reaction at support A
+    R_B: float | np.ndarray  # reaction at support B
+
+
+class UniformLoadResult(NamedTuple):
+    """Moments and reactions for a beam with a uniform distributed load."""
+    M_A: float  # moment at support A
+    M_B: float  # moment at support B
+    M_center: float  # mid-span moment
+    R_A: float  # reaction at support A
+    R_B: float  # reaction at support B
+
+
+class TwoPointLoadResult(NamedTuple):
+    """Moments and reactions for a beam with two equal point loads at L/3 and 2L/3."""
+    M_A: float  # moment at support A
+    M_B: float  # moment at support B
+    M_pos_max: float  # maximum sagging moment (at center)
+    R_A: float  # reaction at support A
+    R_B: float  # reaction at support B
+
+
+def mirror_point_load(result):
+    """
+    Return the point load result mirrored about midspan, i.e. the same load F at L - a.
+    Swaps the support moments and reactions; the moment under the load is unchanged.
+    
+    Parameters:
+    result (BeamResult): Result for a load at distance a from support A.
+    
+    Returns:
+    BeamResult: Result for the same load at distance L - a from support A.
+    """
+    return BeamResult(result.M_B, result.M_A, result.M_F, result.R_B, result.R_A)
 
 
 def fixed_fixed_point_load(F, a, L):
     """
     Calculate moments and reactions for a fixed-fixed beam with a single point load.
+    F and a may be array-like (broadcast against each other) to evaluate many load cases at once.
     
     Parameters:
-    F (float): Point load magnitude (positive downward).
-    a (float): Distance from left support A to load point.
+    F (float or array-like): Point load magnitude (positive downward).
+    a (float or array-like): Distance from left support A to load point.
     L (float): Span length.
     
     Returns:
-    dict: Contains M_A, M_B, M_F, R_A, R_B.
+    BeamResult: Contains M_A, M_B, M_F, R_A, R_B (ndarrays if F or a is array-like).
     
     Sign convention:
     - Loads: Downward positive for F.
     - Moments: Positive for sagging (bottom tension).
     """
+    if np.isscalar(F) and np.isscalar(a) and np.isscalar(L):
+        return _fixed_fixed_point_load_cached(F, a, L)
+    return _fixed_fixed_point_load(np.asarray(F, dtype=float), np.asarray(a, dtype=float), L)
+
+
+def _fixed_fixed_point_load(F, a, L):
     b = L - a
-    M_A = -F * a * b**2 / L**2
-    M_B = -F * a**2 * b / L**2
-    M_F = 2 * F * a**2 * b**2 / L**3
-    R_A = F * (3 * a + b) * b**2 / L**3
-    R_B = F * (a + 3 * b) * a**2 / L**3
-    return {
-        'M_A': M_A,
-        'M_B': M_B,
-        'M_F': M_F,
-        'R_A': R_A,
-        'R_B': R_B
-    }
+    invL = 1.0 / L
+    invL2 = invL * invL
+    invL3 = invL2 * invL
+    a2 = a * a
+    b2 = b * b
+    Fab2 = F * a * b2
+    Fa2b = F * a2 * b
+    M_A = -Fab2 * invL2
+    M_B = -Fa2b * invL2
+    M_F = 2.0 * Fa2b * b * invL3
+    R_A = F * (3 * a + b) * b2 * invL3
+    R_B = F * (a + 3 * b) * a2 * invL3
+    return BeamResult(M_A, M_B, M_F, R_A, R_B)
+
+
+# Scalar load cases repeat across a design run, so memoize them by (F, a, L)
+_fixed_fixed_point_load_cached = functools.lru_cache(maxsize=256)(_fixed_fixed_point_load)
 
 
 def fixed_fixed_uniform_load(q, L):
@@ -42,7 +102,7 @@ def fixed_fixed_uniform_load(q, L):
     L (float): Span length.
     
     Returns:
-    dict: Contains M_A, M_B, M_center, R_A.
+    UniformLoadResult: Contains M_A, M_B, M_center, R_A, R_B.
     
     Sign convention: Same as above.
     """
@@ -50,14 +110,8 @@ def fixed_fixed_uniform_load(q, L):
     M_B = M_A
     M_center = q * L**2 / 24
     R_A = q * L / 2
-    R_B = R_A
-    return {
-        'M_A': M_A,
-        'M_B': M_B,
-        'M_center': M_center,
-        'R_A': R_A,
-        'R_B': R_B  # Symmetric
-    }
+    R_B = R_A  # Symmetric
+    return UniformLoadResult(M_A, M_B, M_center, R_A, R_B)
 
 
 def pinned_pinned_point_load(F, a, L):
@@ -65,24 +119,29 @@ def pinned_pinned_point_load(F, a, L):
     Calculate moments and reactions for a pinned-pinned beam with a single point load.
     
     Parameters:
-    F (float): Point load magnitude (positive downward).
-    a (float): Distance from left support A to load point.
+    F (float or array-like): Point load magnitude (positive downward).
+    a (float or array-like): Distance from left support A to load point.
     L (float): Span length.
     
     Returns:
-    dict: Contains M_F, R_A, R_B.
+    BeamResult: Contains M_F, R_A, R_B (M_A and M_B are zero at pinned supports).
     
     Sign convention: Same as above.
     """
+    if np.isscalar(F) and np.isscalar(a) and np.isscalar(L):
+        return _pinned_pinned_point_load_cached(F, a, L)
+    return _pinned_pinned_point_load(np.asarray(F, dtype=float), np.asarray(a, dtype=float), L)
+
+
+def _pinned_pinned_point_load(F, a, L):
     b = L - a
     M_F = F * a * b / L
     R_A = F * b / L
     R_B = F * a / L
-    return {
-        'M_F': M_F,
-        'R_A': R_A,
-        'R_B': R_B
-    }
+    return BeamResult(0.0, 0.0, M_F, R_A, R_B)
+
+
+_pinned_pinned_point_load_cached = functools.lru_cache(maxsize=256)(_pinned_pinned_point_load)
 
 
 def pinned_pinned_uniform_load(q, L):
@@ -94,25 +153,160 @@ def pinned_pinned_uniform_load(q, L):
     L (float): Span length.
     
     Returns:
-    dict: Contains M_center, R_A.
+    UniformLoadResult: Contains M_center, R_A, R_B (M_A and M_B are zero at pinned supports).
     
     Sign convention: Same as above.
     """
     M_center = q * L**2 / 8
     R_A = q * L / 2
-    R_B = R_A
-    return {
-        'M_center': M_center,
-        'R_A': R_A,
-        'R_B': R_B  # Symmetric
-    }
+    R_B = R_A  # Symmetric
+    return UniformLoadResult(0.0, 0.0, M_center, R_A, R_B)
 
 
-# Note: For two point loads, superposition can be used by calling the single point load function twice.
+# Note: For two point loads, superposition can be used by passing both load positions as an array.
 # Deflection formulas are commented in the reference but not implemented here as they require E and I.
 
 
-def plot_fixed_fixed_point_bmd(F, a, L, save_path=None, num_points=100):
+def _broadcast_loads(F, a):
+    """Broadcast load magnitudes and positions to equal-length contiguous 1-D float arrays."""
+    F, a = np.broadcast_arrays(np.atleast_1d(np.asarray(F, dtype=float)),
+                               np.atleast_1d(np.asarray(a, dtype=float)))
+    return np.ascontiguousarray(F), np.ascontiguousarray(a)
+
+
+def fixed_fixed_multi_point_bmd(F, a, L, x):
+    """
+    Evaluate bending moment diagrams for a fixed-fixed beam with any number of point loads.
+    Each load contributes M_k(x) = M_A,k + R_A,k*x - F_k*max(x - a_k, 0); the superposed
+    diagram is contracted over the loads in a single einsum, with no Python loop.
+    
+    Parameters:
+    F (float or array-like): Point load magnitudes (positive downward); broadcast against a.
+    a (float or array-like): Load positions from left support A; broadcast against F.
+    L (float): Span length.
+    x (ndarray): Positions along the beam at which to evaluate M.
+    
+    Returns:
+    tuple: (M_each, M_total) where M_each has shape (n_loads, len(x)) and M_total is their sum.
+    
+    Sign convention: Same as fixed_fixed_point_load.
+    """
+    F, a = _broadcast_loads(F, a)
+    results = fixed_fixed_point_load(F, a, L)
+    M_A = results.M_A
+    R_A = results.R_A
+    
+    # Ramp basis max(x - a_k, 0), shape (n_loads, len(x))
+    ramp = np.maximum(x[None, :] - a[:, None], 0.0)
+    M_total = M_A.sum() + R_A.sum() * x - np.einsum('k,ki->i', F, ramp)
+    
+    # Reuse the ramp buffer for the individual diagrams
+    M_each = ramp
+    M_each *= -F[:, None]
+    M_each += M_A[:, None] + R_A[:, None] * x[None, :]
+    return M_each, M_total
+
+
+def _bmd_superposed_loop(F, a, M_A_arr, R_A_arr, x, out):
+    # Per-point loop over loads; compiled with numba this runs without NumPy temporaries
+    for i in range(x.size):
+        s = 0.0
+        for k in range(a.size):
+            s += M_A_arr[k] + R_A_arr[k] * x[i] - F[k] * max(x[i] - a[k], 0.0)
+        out[i] = s
+    return out
+
+
+def _bmd_superposed_numpy(F, a, M_A_arr, R_A_arr, x, out):
+    ramp = np.maximum(x[None, :] - a[:, None], 0.0)
+    np.subtract(M_A_arr.sum() + R_A_arr.sum() * x, np.einsum('k,ki->i', F, ramp), out=out)
+    return out
+
+
+@functools.cache
+def _get_bmd_kernel():
+    """Superposed BMD kernel: numba-compiled loop if numba is installed, else the NumPy version.
+    numba is imported here, on first use, so importing this module stays cheap.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional (pip install .[jit]); fall back to NumPy
+        return _bmd_superposed_numpy
+    return njit(cache=True, fastmath=True)(_bmd_superposed_loop)
+
+
+def fixed_fixed_superposed_bmd(F, a, L, x):
+    """
+    Evaluate only the superposed BMD of a fixed-fixed beam with any number of point loads.
+    Intended as the inner kernel of parameter sweeps; JIT-compiled with numba when installed.
+    
+    Parameters:
+    F (float or array-like): Point load magnitudes (positive downward); broadcast against a.
+    a (float or array-like): Load positions from left support A; broadcast against F.
+    L (float): Span length.
+    x (ndarray): Positions along the beam at which to evaluate M.
+    
+    Returns:
+    ndarray: Superposed moment M_total at each x.
+    
+    Sign convention: Same as fixed_fixed_point_load.
+    """
+    # The compiled kernel does no bounds checking, so F and a must have equal length
+    F, a = _broadcast_loads(F, a)
+    x = np.ascontiguousarray(x, dtype=float)
+    results = fixed_fixed_point_load(F, a, L)
+    return _get_bmd_kernel()(F, a, results.M_A, results.R_A, x, np.empty_like(x))
+
+
+# Save-only plots are drawn on one reusable Agg figure, so batch report runs neither
+# load a GUI backend nor accumulate open pyplot figures.
+_SAVE_FIG = None
+
+
+def _get_plot_axes(ax, save_path, figsize):
+    """
+    Return (fig, ax) to draw a BMD on.
+    Uses the given axes if any, the shared Agg figure when only saving, else a new pyplot figure.
+    """
+    global _SAVE_FIG
+    if ax is not None:
+        return ax.figure, ax
+    if save_path:
+        if _SAVE_FIG is None:
+            _SAVE_FIG = Figure()
+            FigureCanvasAgg(_SAVE_FIG)
+            _SAVE_FIG.add_subplot()
+        _SAVE_FIG.set_size_inches(figsize)
+        ax = _SAVE_FIG.axes[0]
+        ax.clear()
+        return _SAVE_FIG, ax
+    return plt.subplots(figsize=figsize)
+
+
+def _finish_plot(fig, own_axes, save_path):
+    """Save or display the figure; pyplot figures created here are closed afterwards."""
+    if save_path:
+        fig.savefig(save_path, dpi=300, bbox_inches='tight')
+        print(f"Plot saved to {save_path}")
+    elif own_axes:
+        plt.show()
+    if own_axes and fig is not _SAVE_FIG:
+        plt.close(fig)
+
+
+def _idx_of(a, L, n):
+    """Index of the grid point nearest to a on the uniform grid np.linspace(0, L, n), clamped to the grid."""
+    return min(max(int(round(a * (n - 1) / L)), 0), n - 1)
+
+
+def _padded_ylim(M):
+    """y-limits spanning M with 10% padding of its largest magnitude on both sides."""
+    mn, mx = M.min(), M.max()
+    pad = 0.1 * max(abs(mn), abs(mx))
+    return mn - pad, mx + pad
+
+
+def plot_fixed_fixed_point_bmd(F, a, L, save_path=None, num_points=100, ax=None):
     """
     Plot the bending moment diagram (BMD) for a fixed-fixed beam with a single point load.
     
@@ -122,63 +316,48 @@ def plot_fixed_fixed_point_bmd(F, a, L, save_path=None, num_points=100):
     L (float): Span length.
     save_path (str, optional): Path to save the plot (e.g., 'bmd.png'). If None, displays the plot.
     num_points (int): Number of points to discretize the beam for plotting.
+    ax (Axes, optional): Axes to draw on. If given and save_path is None, the caller shows the figure.
     
     Sign convention: Same as fixed_fixed_point_load.
     """
     # Get moments and reactions
-    results = fixed_fixed_point_load(F, a, L)
-    M_A = results['M_A']
-    M_B = results['M_B']
-    M_F = results['M_F']
-    R_A = results['R_A']
-    R_B = results['R_B']
-    
-    b = L - a
+    M_A, M_B, M_F, R_A, R_B = fixed_fixed_point_load(F, a, L)
     
-    # Generate x points
-    x_left = np.linspace(0, a, num_points//2 + 1)
-    x_right = np.linspace(a, L, num_points//2 + 1)
-    x = np.concatenate([x_left[:-1], x_right])  # Avoid duplicating a
-    
-    # Compute M(x)
-    M_left = M_A + R_A * x_left[:-1]  # For 0 <= x < a
-    M_right = M_F + (R_A - F) * (x_right[1:] - a)
-    M = np.concatenate([M_left, M_right])
-    
-    # At x=a, include M_F
-    x_full = np.concatenate([x_left, x_right[1:]])
-    M_full = np.concatenate([M_A + R_A * x_left, M_F + (R_A - F) * (x_right[1:] - a)])
+    # Uniform grid with the load point inserted so the kink at x=a is drawn exactly;
+    # branch-free M(x) = M_A + R_A*x - F*max(x - a, 0)
+    x_full = np.linspace(0, L, num_points)
+    if not np.isin(a, x_full):
+        x_full = np.insert(x_full, np.searchsorted(x_full, a), a)
+    M_full = M_A + R_A * x_full - F * np.maximum(x_full - a, 0.0)
     
     # Plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(x_full, M_full, 'b-', linewidth=2, label='BMD')
+    own_axes = ax is None
+    fig, ax = _get_plot_axes(ax, save_path, figsize=(10, 6))
+    ax.plot(x_full, M_full, 'b-', linewidth=2, label='BMD')
     
     # Mark key points
-    plt.plot(0, M_A, 'ro', markersize=8, label=f'M_A = {M_A:.2f}')
-    plt.plot(a, M_F, 'go', markersize=8, label=f'M_F = {M_F:.2f}')
-    plt.plot(L, M_B, 'ro', markersize=8, label=f'M_B = {M_B:.2f}')
+    ax.plot(0, M_A, 'ro', markersize=8, label=f'M_A = {M_A:.2f}')
+    ax.plot(a, M_F, 'go', markersize=8, label=f'M_F = {M_F:.2f}')
+    ax.plot(L, M_B, 'ro', markersize=8, label=f'M_B = {M_B:.2f}')
     
     # Load position
-    plt.axvline(x=a, color='k', linestyle='--', alpha=0.5, label=f'Load at x={a}')
+    ax.axvline(x=a, color='k', linestyle='--', alpha=0.5, label=f'Load at x={a}')
     
-    plt.xlabel('Distance x (m)')
-    plt.ylabel('Bending Moment M (kN·m)')
-    plt.title(f'Bending Moment Diagram: Fixed-Fixed Beam, F={F} kN at a={a} m, L={L} m')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.ylim(min(M_full) * 1.1, max(M_full) * 1.1)  # Adjust y-limits for visibility
+    ax.set_xlabel('Distance x (m)')
+    ax.set_ylabel('Bending Moment M (kN·m)')
+    ax.set_title(f'Bending Moment Diagram: Fixed-Fixed Beam, F={F} kN at a={a} m, L={L} m')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_ylim(*_padded_ylim(M_full))  # Adjust y-limits for visibility
     
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {save_path}")
-    else:
-        plt.show()
+    _finish_plot(fig, own_axes, save_path)
     
     # Optional: Return x and M for further use
     return x_full, M_full
 
 
-def plot_fixed_fixed_superposed_bmd(F1, a1, F2, a2, L, save_path=None, num_points=200):
+def plot_fixed_fixed_superposed_bmd(F1, a1, F2, a2, L, save_path=None, num_points=200, ax=None,
+                                    legend_loc='lower center'):
     """
     Plot individual and superposed bending moment diagrams for a fixed-fixed beam with two point loads.
     Uses superposition: Computes BMD for each load separately and sums them.
@@ -191,6 +370,9 @@ def plot_fixed_fixed_superposed_bmd(F1, a1, F2, a2, L, save_path=None, num_point
     L (float): Span length.
     save_path (str, optional): Path to save the plot. If None, displays.
     num_points (int): Number of points for discretization (higher for smoother plots).
+    ax (Axes, optional): Axes to draw on. If given and save_path is None, the caller shows the figure.
+    legend_loc (str): Legend location. 'best' does not see the BMD curves (drawn as one LineCollection),
+        so the default suits symmetric loading; pass e.g. 'upper right' for loads bunched near a support.
     
     Returns:
     tuple: (x_full, M_total, max_positive_M) where max_positive_M is the maximum sagging moment.
@@ -200,57 +382,56 @@ def plot_fixed_fixed_superposed_bmd(F1, a1, F2, a2, L, save_path=None, num_point
     # Generate common x grid
     x_full = np.linspace(0, L, num_points)
     
-    # Compute BMD for first load
-    results1 = fixed_fixed_point_load(F1, a1, L)
-    M1 = np.where(x_full <= a1, 
-                  results1['M_A'] + results1['R_A'] * x_full,
-                  results1['M_F'] + (results1['R_A'] - F1) * (x_full - a1))
-    
-    # Compute BMD for second load
-    results2 = fixed_fixed_point_load(F2, a2, L)
-    M2 = np.where(x_full <= a2, 
-                  results2['M_A'] + results2['R_A'] * x_full,
-                  results2['M_F'] + (results2['R_A'] - F2) * (x_full - a2))
-    
-    # Superpose
-    M_total = M1 + M2
+    # Compute and superpose BMDs for both loads
+    M_each, M_total = fixed_fixed_multi_point_bmd([F1, F2], [a1, a2], L, x_full)
+    M1, M2 = M_each
     
     # Find max positive moment
     positive_M = M_total[M_total > 0]
     max_positive_M = np.max(positive_M) if len(positive_M) > 0 else 0
     
     # Plot
-    plt.figure(figsize=(12, 8))
-    plt.plot(x_full, M1, 'r--', linewidth=2, label=f'BMD Load 1 (F={F1} kN at x={a1} m)')
-    plt.plot(x_full, M2, 'g--', linewidth=2, label=f'BMD Load 2 (F={F2} kN at x={a2} m)')
-    plt.plot(x_full, M_total, 'b-', linewidth=3, label=f'Superposed BMD (Max +M = {max_positive_M:.2f} kN·m)')
+    own_axes = ax is None
+    fig, ax = _get_plot_axes(ax, save_path, figsize=(12, 8))
+    # Draw all three curves as one LineCollection (a single artist instead of three lines)
+    segments = np.stack([np.column_stack([x_full, M1]),
+                         np.column_stack([x_full, M2]),
+                         np.column_stack([x_full, M_total])])
+    colors = ['r', 'g', 'b']
+    linestyles = ['--', '--', '-']
+    linewidths = [2, 2, 3]
+    ax.add_collection(LineCollection(segments, colors=colors, linestyles=linestyles, linewidths=linewidths))
+    curve_labels = [f'BMD Load 1 (F={F1} kN at x={a1} m)',
+                    f'BMD Load 2 (F={F2} kN at x={a2} m)',
+                    f'Superposed BMD (Max +M = {max_positive_M:.2f} kN·m)']
+    # Legend proxies for the collection's curves; not added to the axes
+    curve_handles = [Line2D([], [], color=c, linestyle=ls, linewidth=lw)
+                     for c, ls, lw in zip(colors, linestyles, linewidths)]
     
     # Mark key points for total (ends and load positions)
     M_total_A = M_total[0]
     M_total_B = M_total[-1]
-    M_total_at_a1 = M_total[np.argmin(np.abs(x_full - a1))]
-    M_total_at_a2 = M_total[np.argmin(np.abs(x_full - a2))]
-    plt.plot(0, M_total_A, 'ro', markersize=8, label=f'M_A total = {M_total_A:.2f}')
-    plt.plot(a1, M_total_at_a1, 'go', markersize=8)
-    plt.plot(a2, M_total_at_a2, 'mo', markersize=8)
-    plt.plot(L, M_total_B, 'ro', markersize=8, label=f'M_B total = {M_total_B:.2f}')
+    M_total_at_a1 = M_total[_idx_of(a1, L, num_points)]
+    M_total_at_a2 = M_total[_idx_of(a2, L, num_points)]
+    ax.plot(0, M_total_A, 'ro', markersize=8, label=f'M_A total = {M_total_A:.2f}')
+    ax.plot(a1, M_total_at_a1, 'go', markersize=8)
+    ax.plot(a2, M_total_at_a2, 'mo', markersize=8)
+    ax.plot(L, M_total_B, 'ro', markersize=8, label=f'M_B total = {M_total_B:.2f}')
     
     # Load positions
-    plt.axvline(x=a1, color='r', linestyle=':', alpha=0.5)
-    plt.axvline(x=a2, color='g', linestyle=':', alpha=0.5)
+    ax.axvline(x=a1, color='r', linestyle=':', alpha=0.5)
+    ax.axvline(x=a2, color='g', linestyle=':', alpha=0.5)
     
-    plt.xlabel('Distance x (m)')
-    plt.ylabel('Bending Moment M (kN·m)')
-    plt.title(f'BMD Superposition: Fixed-Fixed Beam, Loads at {a1}m & {a2}m, L={L} m')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.ylim(min(M_total) * 1.1, max(M_total) * 1.1)
+    ax.set_xlabel('Distance x (m)')
+    ax.set_ylabel('Bending Moment M (kN·m)')
+    ax.set_title(f'BMD Superposition: Fixed-Fixed Beam, Loads at {a1}m & {a2}m, L={L} m')
+    ax.grid(True, alpha=0.3)
+    marker_handles, marker_labels = ax.get_legend_handles_labels()
+    ax.legend(curve_handles + marker_handles, curve_labels + marker_labels, loc=legend_loc)
+    ax.set_xlim(-0.05 * L, 1.05 * L)  # add_collection does not autoscale
+    ax.set_ylim(*_padded_ylim(M_total))
     
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Plot saved to {save_path}")
-    else:
-        plt.show()
+    _finish_plot(fig, own_axes, save_path)
     
     return x_full, M_total, max_positive_M
 
@@ -265,7 +446,7 @@ def fixed_fixed_two_point_load(F, L):
     L (float): Span length.
     
     Returns:
-    dict: Contains M_A, M_B (end moments, symmetric), M_pos_max (at center), R_A, R_B (symmetric).
+    TwoPointLoadResult: Contains M_A, M_B (end moments, symmetric), M_pos_max (at center), R_A, R_B (symmetric).
     
     Sign convention: Positive moments sagging; ends hogging (negative).
     """
@@ -273,44 +454,26 @@ def fixed_fixed_two_point_load(F, L):
     a2 = 2 * L / 3
     
     # First load at a1 = L/3
-    results1 = fixed_fixed_point_load(F, a1, L)
-    M_A1 = results1['M_A']
-    M_B1 = results1['M_B']
-    R_A1 = results1['R_A']
-    R_B1 = results1['R_B']
-    
-    # Second load at a2 = 2L/3 (symmetric to first from right)
-    results2 = fixed_fixed_point_load(F, a2, L)
-    M_A2 = results2['M_A']
-    M_B2 = results2['M_B']
-    R_A2 = results2['R_A']
-    R_B2 = results2['R_B']
+    M_A1, M_B1, M_F1, R_A1, R_B1 = fixed_fixed_point_load(F, a1, L)
     
+    # Second load at a2 = 2L/3 (symmetric to first from right): support fields swap
     # Superpose
-    M_A = M_A1 + M_A2
-    M_B = M_B1 + M_B2
-    R_A = R_A1 + R_A2
-    R_B = R_B1 + R_B2
-    
-    # Max positive moment at center (x = L/2) by superposition
-    # For each single load, M(L/2) = FL/18 (as derived), so total 2*(FL/18) = FL/9
-    # But compute numerically for consistency
-    M_pos_max = (results1['M_F'] + (results1['R_A'] - F) * (L/2 - a1)) + \
-                (results2['M_F'] + (results2['R_A'] - F) * (L/2 - a2))
-    
-    return {
-        'M_A': M_A,
-        'M_B': M_B,
-        'M_pos_max': M_pos_max,
-        'R_A': R_A,
-        'R_B': R_B
-    }
+    M_A = M_A1 + M_B1
+    M_B = M_B1 + M_A1
+    R_A = R_A1 + R_B1
+    R_B = R_B1 + R_A1
+    
+    # Max positive moment at center (x = L/2) by superposition, closed form:
+    # each load gives M(L/2) = M_A,k + R_A,k*L/2 - F*max(L/2 - a_k, 0) = FL/18, so total FL/9
+    M_pos_max = F * L / 9.0
+    
+    return TwoPointLoadResult(M_A, M_B, M_pos_max, R_A, R_B)
 
 
 # Example usage (commented out):
 # results = fixed_fixed_two_point_load(F=10, L=6)
-# print(f"M_neg_max: {results['M_A']:.2f} kN·m")  # ≈ -13.33
-# print(f"M_pos_max: {results['M_pos_max']:.2f} kN·m")  # ≈ 6.67 (FL/9 = 60/9 ≈6.67)
+# print(f"M_neg_max: {results.M_A:.2f} kN·m")  # ≈ -13.33
+# print(f"M_pos_max: {results.M_pos_max:.2f} kN·m")  # ≈ 6.67 (FL/9 = 60/9 ≈6.67)
 
 if __name__ == "__main__":
     # Example for 1/3 L and 2/3 L (uncomment to run):
@@ -0,0 +1,114 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from beam_analysis import (
+    _bmd_superposed_numpy,
+    _broadcast_loads,
+    _get_bmd_kernel,
+    _idx_of,
+    fixed_fixed_multi_point_bmd,
+    fixed_fixed_point_load,
+    fixed_fixed_superposed_bmd,
+    fixed_fixed_two_point_load,
+    pinned_pinned_point_load,
+    plot_fixed_fixed_point_bmd,
+    plot_fixed_fixed_superposed_bmd,
+)
+
+LOAD_CASES = [
+    ([10.0, 5.0, 3.0], [1.0, 2.5, 5.0]),
+    (10.0, [2.0, 4.0]),  # equal loads at several positions
+    ([10.0, 10.0], [3.0]),  # several loads at one position
+]
+
+
+def _reference_bmd(F, a, L, x):
+    """Superposed BMD summed load by load: M_A + R_A*x - F*max(x - a, 0)."""
+    M = np.zeros_like(x)
+    for F_k, a_k in zip(*_broadcast_loads(F, a)):
+        r = fixed_fixed_point_load(float(F_k), float(a_k), L)
+        M += r.M_A + r.R_A * x - F_k * np.maximum(x - a_k, 0.0)
+    return M
+
+
+@pytest.mark.parametrize("F, a", LOAD_CASES)
+def test_multi_point_bmd_broadcasts_loads(F, a):
+    L = 6.0
+    x = np.linspace(0, L, 61)
+    M_each, M_total = fixed_fixed_multi_point_bmd(F, a, L, x)
+    assert M_each.shape == (_broadcast_loads(F, a)[0].size, x.size)
+    np.testing.assert_allclose(M_total, _reference_bmd(F, a, L, x), atol=1e-12)
+    np.testing.assert_allclose(M_each.sum(axis=0), M_total, atol=1e-12)
+
+
+@pytest.mark.parametrize("a", [3.0, 2.0, 0.7])
+def test_point_bmd_grid_contains_load_point(a, tmp_path):
+    F, L = 10.0, 6.0
+    x, M = plot_fixed_fixed_point_bmd(F, a, L, save_path=tmp_path / "bmd.png")
+    assert np.all(np.diff(x) > 0)
+    assert a in x
+    assert M.max() == pytest.approx(fixed_fixed_point_load(F, a, L).M_F)
+
+
+@pytest.mark.parametrize("a", [-0.3, -1e-12, 0.0, 1.234, 2.05, 6.0, 6.0 + 1e-12, 6.4])
+def test_idx_of_matches_nearest_grid_point(a):
+    L, n = 6.0, 200
+    x = np.linspace(0, L, n)
+    assert _idx_of(a, L, n) == np.argmin(np.abs(x - a))
+
+
+@pytest.mark.parametrize("F, L", [(10.0, 6.0), (358.3872, 10.8)])
+def test_two_point_load_midspan_moment(F, L):
+    result = fixed_fixed_two_point_load(F, L)
+    assert result.M_pos_max == pytest.approx(F * L / 9)
+    # Numerical recomputation: M_A + R_A*x - F*max(x - a, 0) at x = L/2, summed over both loads
+    x = L / 2
+    M_center = 0.0
+    for a in (L / 3, 2 * L / 3):
+        r = fixed_fixed_point_load(F, a, L)
+        M_center += r.M_A + r.R_A * x - F * max(x - a, 0.0)
+    assert result.M_pos_max == pytest.approx(M_center)
+
+
+@pytest.mark.parametrize("F, a", LOAD_CASES)
+def test_superposed_bmd_matches_numpy_kernel(F, a):
+    L = 6.0
+    x = np.linspace(0, L, 61)
+    M_total = fixed_fixed_superposed_bmd(F, a, L, x)
+    _, expected = fixed_fixed_multi_point_bmd(F, a, L, x)
+    np.testing.assert_allclose(M_total, expected, atol=1e-12)
+    F_b, a_b = _broadcast_loads(F, a)
+    r = fixed_fixed_point_load(F_b, a_b, L)
+    numpy_total = _bmd_superposed_numpy(F_b, a_b, r.M_A, r.R_A, x, np.empty_like(x))
+    np.testing.assert_allclose(M_total, numpy_total, atol=1e-12)
+
+
+def test_superposed_bmd_jit_kernel_is_used_when_numba_installed():
+    pytest.importorskip("numba")
+    assert _get_bmd_kernel() is not _bmd_superposed_numpy
+
+
+def test_superposed_bmd_plot_legend_lists_each_curve():
+    fig, ax = plt.subplots()
+    try:
+        plot_fixed_fixed_superposed_bmd(10.0, 0.5, 10.0, 1.0, 6.0, ax=ax, legend_loc='upper right')
+        legend_texts = [t.get_text() for t in ax.get_legend().get_texts()]
+        assert legend_texts[0].startswith('BMD Load 1')
+        assert legend_texts[1].startswith('BMD Load 2')
+        assert legend_texts[2].startswith('Superposed BMD')
+        assert legend_texts[3].startswith('M_A total')
+    finally:
+        plt.close(fig)
+
+
+@pytest.mark.parametrize("load_fn", [fixed_fixed_point_load, pinned_pinned_point_load])
+def test_point_load_accepts_array_inputs(load_fn):
+    F = np.array([10.0, 5.0])
+    vectorized = load_fn(F, 2.0, 6.0)
+    for k, F_k in enumerate(F):
+        scalar = load_fn(float(F_k), 2.0, 6.0)
+        np.testing.assert_allclose([vectorized.M_F[k], vectorized.R_A[k], vectorized.R_B[k]],
+                                   [scalar.M_F, scalar.R_A, scalar.R_B])
+    # A 0-d array span is unhashable and must bypass the cache
+    assert load_fn(10.0, 2.0, np.array(6.0)).M_F == pytest.approx(load_fn(10.0, 2.0, 6.0).M_F)
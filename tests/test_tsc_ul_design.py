@@ -0,0 +1,22 @@
+import pytest
+
+from tsc_ul_design import DesignInputs, TSCULDesign
+
+
+def _inputs(**overrides):
+    return DesignInputs(upper_angle_section={'b': 100, 't': 10}, **overrides)
+
+
+def test_module2_fixed_two_girder_x_demand_is_pl_over_9():
+    design = TSCULDesign(_inputs(num_y_girders=2, x_support_condition='fixed'))
+    result = design.module2_construction_load_check()
+    p, l_x = result['point_load_p'], design.inputs.x_span
+    assert result['x_required_mu'] == pytest.approx(p * l_x / 9)
+    assert result['x_required_mu'] == pytest.approx(430.06464)
+
+
+def test_module2_warns_on_every_run_for_unsupported_girder_count(capsys):
+    design = TSCULDesign(_inputs(num_y_girders=3))
+    for _ in range(2):
+        design.module2_construction_load_check()
+        assert "Warning: num_y_girders=3" in capsys.readouterr().out
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from typing import Dict, Any
 import matplotlib.pyplot as plt  # For visualization in module 5
-from beam_analysis import fixed_fixed_uniform_load, pinned_pinned_point_load, pinned_pinned_uniform_load, fixed_fixed_two_point_load, fixed_fixed_point_load
+from beam_analysis import fixed_fixed_uniform_load, pinned_pinned_point_load, pinned_pinned_uniform_load, fixed_fixed_two_point_load, fixed_fixed_point_load, mirror_point_load
 
-@dataclass
+# Load-case functions by support condition (supports are validated once in DesignInputs)
+_UNIFORM_LOAD = {'pinned': pinned_pinned_uniform_load, 'fixed': fixed_fixed_uniform_load}
+_POINT_LOAD = {'pinned': pinned_pinned_point_load, 'fixed': fixed_fixed_point_load}
+
+@dataclass(frozen=True, slots=True)
 class DesignInputs:
     """Module 1: Design variables input as per PRD section 3.1"""
     # Design conditions
@@ -34,12 +38,19 @@ class DesignInputs:
     rebar_spacing: float = 100.0  # mm along beam
     web_clear_height: float = 500.0  # mm, clear vertical spacing between inner faces
 
+    def __post_init__(self):
+        if self.y_support_condition not in _UNIFORM_LOAD:
+            raise ValueError("y_support_condition must be 'pinned' or 'fixed'")
+        if self.x_support_condition not in _POINT_LOAD:
+            raise ValueError(f"Invalid support: {self.x_support_condition}")
+
 class TSCULDesign:
     """Main class for TSC UL type design program"""
     
     def __init__(self, inputs: DesignInputs):
         self.inputs = inputs
         self.results = {}  # To store results from each module
+        self._m2_cache = {}  # Module 2 demands (mu/vu) keyed by load case, reused across repeated runs
     
     def module1_input(self) -> DesignInputs:
         """Module 1: Handle input of design variables.
@@ -60,97 +71,55 @@ class TSCULDesign:
         Returns: Dict with results for x and y directions.
         """
         print("Module 2: Performing construction load checks...")
+        inputs = self.inputs
+        n = inputs.num_y_girders
+        l_x = inputs.x_span  # m
+        l_y = inputs.y_span  # m
+        x_support = inputs.x_support_condition
+        y_support = inputs.y_support_condition
         
         # y-dir girder loads (num_y_girders beams, tributary width = y_span / (num_y_girders + 1))
-        tributary_width_y = self.inputs.x_span / (self.inputs.num_y_girders + 1)  # m
-        dl_y = self.inputs.slab_thickness * self.inputs.concrete_density * tributary_width_y  # kN/m (uniform)
-        ll_y = self.inputs.construction_live_load * tributary_width_y  # kN/m (uniform)
+        tributary_width_y = l_x / (n + 1)  # m
+        dl_y = inputs.slab_thickness * inputs.concrete_density * tributary_width_y  # kN/m (uniform)
+        ll_y = inputs.construction_live_load * tributary_width_y  # kN/m (uniform)
 
         w_y = 1.2*dl_y + 1.6*ll_y  # 1.2DL+1.6LL, total uniform load kN/m
         
-        # y-dir girder DEMAND. uniform load, support-dependent
-        l_y = self.inputs.y_span  # m
-
-        if self.inputs.y_support_condition == 'pinned':
-            y_result = pinned_pinned_uniform_load(w_y, l_y)
-            mu_y = y_result['M_center']
-            vu_y = y_result['R_A']
-
-        elif self.inputs.y_support_condition == 'fixed':
-            y_result = fixed_fixed_uniform_load(w_y, l_y)
-            mu_y_pos = y_result['M_center'] #  moment kNm (중앙부, 정모멘트)
-            vu_y = y_result['R_A']
-            mu_y_neg = y_result['M_A']  # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴
-            mu_y = mu_y_pos # 일단은 정모멘트만 검토함
-        else:
-            raise ValueError("y_support_condition must be 'pinned' or 'fixed'")
-        
         # x-dir girder loads: point loads from y-dir reactions at positions depending on num_y_girders
         # Each point load P = (w_y * y_span)  (end reaction per y-beam, assuming symmetric placement)
         # Note: Total point loads = n 
         # For n=1: position L/2, single P
         # For n=2: positions L/3, 2L/3, two P's
-        n = self.inputs.num_y_girders
-        p = (w_y * self.inputs.y_span)  # kN per point load (상하부 y축 beam이 평면상 상하 대칭으로 존재하기때문에. y_span 전체를 사용해야함.)
-        l_x = self.inputs.x_span  # m
-
-        if n == 1:
-            pos = l_x / 2
-            if self.inputs.x_support_condition == "pinned":
-                x_result = pinned_pinned_point_load(p, pos, l_x)
-                mu_x = x_result['M_F']
-                vu_x = x_result['R_A']
-
-            elif self.inputs.x_support_condition == "fixed":
-                x_result = fixed_fixed_point_load(p, pos, l_x)
-                mu_x_pos = x_result['M_F'] # moment kNm (중앙부, 정모멘트)
-                vu_x = x_result['R_A']
-                mu_x_neg = x_result['M_A'] # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴
-                mu_x = mu_x_pos # 일단은 정모멘트만 검토
-            else:
-                raise ValueError(f"Invalid support: {self.inputs.x_support_condition}")
-
-        elif n == 2:
-            pos1 = l_x / 3
-            pos2 = 2 * l_x / 3
-            if self.inputs.x_support_condition == "pinned":
-                x_result1 = pinned_pinned_point_load(p, pos1, l_x)
-                x_result2 = pinned_pinned_point_load(p, pos2, l_x)
-                mu_x = x_result1['M_F'] + x_result2['M_F']
-                vu_x = x_result1['R_A'] + x_result2['R_A']
-
-            elif self.inputs.x_support_condition == "fixed":
-                x_results = fixed_fixed_two_point_load(p, l_x)
-                mu_x_pos = x_results['M_pos_max'] # moment kNm (중앙부, 정모멘트)
-                vu_x = x_results['R_A']
-                mu_x_neg = x_results['M_A'] # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴
-                mu_x = mu_x_pos # 일단은 정모멘트만 검토
-            else:
-                raise ValueError(f"Invalid support: {self.inputs.x_support_condition}")
-        else:
+        p = (w_y * l_y)  # kN per point load (상하부 y축 beam이 평면상 상하 대칭으로 존재하기때문에. y_span 전체를 사용해야함.)
+        
+        # Demands depend only on this key, so repeated runs with the same load case reuse them
+        key = (n, x_support, y_support, w_y, l_y, p, l_x)
+        demand = self._m2_cache.get(key)
+        if demand is None:
+            demand = self._m2_cache[key] = self._construction_demand(*key)
+        mu_y, vu_y, mu_x, vu_x = demand
+        if n > 2:  # outside the cache so every run warns about the placeholder x-demand
             print(f"Warning: num_y_girders={n} >2; 코드를 수정하세요")
-            mu_x = 0.0  # placeholder
-            vu_x = 0.0
         
         # Capacities for construction phase (angles + rebar web equivalent)
-        upper_angle = self.inputs.upper_angle_section
+        upper_angle = inputs.upper_angle_section
         a = upper_angle['b']  # mm, leg length
         t = upper_angle['t']  # mm, thickness
         A_angle = 2 * a * t - t**2  # mm²
         A_f = 2 * A_angle  # mm² per one angle (two angles per top chord)
         c = t * ((a - t) * (t / 2) + a * (a / 2)) / A_angle  # mm from outer face of horizontal leg
         c_inner = c - t  # mm to inner face
-        h_clear = self.inputs.web_clear_height  # mm, clear vertical spacing between inner faces
+        h_clear = inputs.web_clear_height  # mm, clear vertical spacing between inner faces
         d = h_clear + 2 * c_inner  # mm, distance between flange centroids
         Z_x = A_f * d  # mm³, approximate plastic modulus (flanges dominate)
-        fy = self.inputs.angle_fy  # MPa
+        fy = inputs.angle_fy  # MPa
         capacity_mn_y = fy * Z_x * 1e-6  # kNm
         capacity_mn_x = capacity_mn_y  # assume same section for x-dir
         
         # Shear capacity using equivalent web from rebars
-        h_w = self.inputs.web_clear_height  # mm, web height (using clear height)
-        s = self.inputs.rebar_spacing  # mm, rebar spacing along beam
-        A_b = self.inputs.rebar_area  # mm² per rebar
+        h_w = inputs.web_clear_height  # mm, web height (using clear height)
+        s = inputs.rebar_spacing  # mm, rebar spacing along beam
+        A_b = inputs.rebar_area  # mm² per rebar
         num_sides = 2  # left and right
         t_w = num_sides * A_b / s  # equivalent web thickness, mm
         A_w = t_w * h_clear  # mm²
@@ -190,8 +159,8 @@ class TSCULDesign:
             'point_load_p': p,
             'num_y_girders': n,
             'x_point_positions': positions,
-            'y_support_condition': self.inputs.y_support_condition,
-            'x_support_condition': self.inputs.x_support_condition,
+            'y_support_condition': y_support,
+            'x_support_condition': x_support,
             # Shear properties
             'h_w': h_clear,
             's': s,
@@ -208,6 +177,45 @@ class TSCULDesign:
         self.results['module2'] = result
         return result
     
+    def _construction_demand(self, n, x_support, y_support, w_y, l_y, p, l_x):
+        """Module 2 helper: y-dir (uniform w_y) and x-dir (n point loads p) demands.
+        Returns: (mu_y, vu_y, mu_x, vu_x) in kNm / kN.
+        """
+        # y-dir girder DEMAND. uniform load, support-dependent
+        y_result = _UNIFORM_LOAD[y_support](w_y, l_y)
+        mu_y_pos = y_result.M_center #  moment kNm (중앙부, 정모멘트)
+        vu_y = y_result.R_A
+        mu_y_neg = y_result.M_A  # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴 (pinned: 0)
+        mu_y = mu_y_pos # 일단은 정모멘트만 검토함
+        
+        # x-dir girder DEMAND. point loads, support-dependent
+        if n == 1:
+            pos = l_x / 2
+            x_result = _POINT_LOAD[x_support](p, pos, l_x)
+            mu_x_pos = x_result.M_F # moment kNm (중앙부, 정모멘트)
+            vu_x = x_result.R_A
+            mu_x_neg = x_result.M_A # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴 (pinned: 0)
+            mu_x = mu_x_pos # 일단은 정모멘트만 검토
+
+        elif n == 2:
+            pos1 = l_x / 3
+            if x_support == "fixed":
+                x_results = fixed_fixed_two_point_load(p, l_x)
+                mu_x_pos = x_results.M_pos_max # moment kNm (중앙부, 정모멘트)
+                vu_x = x_results.R_A
+                mu_x_neg = x_results.M_A # max moment kNm (양단부, 부모멘트), 값이 음수로 나옴
+                mu_x = mu_x_pos # 일단은 정모멘트만 검토
+            else:
+                x_result1 = pinned_pinned_point_load(p, pos1, l_x)
+                x_result2 = mirror_point_load(x_result1)  # load at 2L/3 mirrors pos1
+                mu_x = x_result1.M_F + x_result2.M_F
+                vu_x = x_result1.R_A + x_result2.R_A
+        else:
+            mu_x = 0.0  # placeholder (warning printed by module2_construction_load_check)
+            vu_x = 0.0
+        
+        return mu_y, vu_y, mu_x, vu_x
+    
     def module3_formwork_pressure_check(self) -> Dict[str, Any]:
         """Module 3: Formwork lateral pressure strength calculation and comparison.
         As per PRD section 3.3: Calculate concrete lateral pressure, equivalent load w, Mu_form, Vu_form, deflection.